@@ -15,6 +15,9 @@ Configuration sources (in priority order):
 """
 import sys
 import os
+import re
+import shutil
+import threading
 import importlib
 import importlib.util
 import importlib.abc
@@ -31,14 +34,29 @@ os.environ.setdefault('VLLM_RPC_TIMEOUT', '1800000')
 # Configuration Management
 # ==============================================================================
 
+# Matches one "start-end" pair; findall() scans the whole ranges string in
+# a single pass at C speed.
+_RANGE_RE = re.compile(r'(\d+)\s*-\s*(\d+)')
+
+# Accepted truthy spellings for boolean environment variables
+_TRUE = frozenset(('true', '1', 'yes', 'on'))
+
+
+def _envbool(env, key, default):
+    """Read a boolean from env, returning default when the key is unset."""
+    value = env.get(key)
+    return value.lower() in _TRUE if value is not None else default
+
 class ProfilerConfig:
     """Manages profiler configuration from multiple sources."""
 
     def __init__(self):
         self.ranges: List[Tuple[int, int]] = []
         self.activities: List[str] = ["CPU", "CUDA"]
-        self.record_shapes: bool = True
-        self.with_stack: bool = True
+        # Shape recording and stack capture add substantial per-op profiler
+        # overhead and inflate trace size, so both are opt-in.
+        self.record_shapes: bool = False
+        self.with_stack: bool = False
         self.profile_memory: bool = False
         self.with_modules: bool = False
         self.export_chrome_trace: bool = True
@@ -80,12 +98,11 @@ class ProfilerConfig:
             "profiler_config.yaml"
         )
 
-        if not os.path.exists(config_path):
-            return
-
         try:
-            import yaml
+            # Open directly instead of os.path.exists + open: one stat
+            # syscall instead of two, and no exists/open race.
             with open(config_path, 'r') as f:
+                import yaml
                 config = yaml.safe_load(f)
 
             if config:
@@ -122,6 +139,9 @@ class ProfilerConfig:
                 self.target_method = adv.get('target_method', self.target_method)
                 self.debug = adv.get('debug', self.debug)
 
+        except FileNotFoundError:
+            # No config file, use defaults/env
+            pass
         except ImportError:
             # PyYAML not available, skip file-based config
             pass
@@ -130,35 +150,38 @@ class ProfilerConfig:
 
     def _load_from_env(self):
         """Load configuration from environment variables."""
+        env = os.environ
+
         # Profiling ranges
-        if 'VLLM_PROFILER_RANGES' in os.environ:
-            self.ranges = self._parse_ranges(os.environ['VLLM_PROFILER_RANGES'])
+        if 'VLLM_PROFILER_RANGES' in env:
+            self.ranges = self._parse_ranges(env['VLLM_PROFILER_RANGES'])
 
         # Activities
-        if 'VLLM_PROFILER_ACTIVITIES' in os.environ:
-            self.activities = [a.strip() for a in os.environ['VLLM_PROFILER_ACTIVITIES'].split(',')]
+        if 'VLLM_PROFILER_ACTIVITIES' in env:
+            self.activities = [a.strip() for a in env['VLLM_PROFILER_ACTIVITIES'].split(',')]
 
         # Options
-        if 'VLLM_PROFILER_RECORD_SHAPES' in os.environ:
-            self.record_shapes = os.environ['VLLM_PROFILER_RECORD_SHAPES'].lower() in ('true', '1', 'yes')
-
-        if 'VLLM_PROFILER_WITH_STACK' in os.environ:
-            self.with_stack = os.environ['VLLM_PROFILER_WITH_STACK'].lower() in ('true', '1', 'yes')
-
-        if 'VLLM_PROFILER_MEMORY' in os.environ:
-            self.profile_memory = os.environ['VLLM_PROFILER_MEMORY'].lower() in ('true', '1', 'yes')
+        self.record_shapes = _envbool(env, 'VLLM_PROFILER_RECORD_SHAPES', self.record_shapes)
+        self.with_stack = _envbool(env, 'VLLM_PROFILER_WITH_STACK', self.with_stack)
+        self.profile_memory = _envbool(env, 'VLLM_PROFILER_MEMORY', self.profile_memory)
 
         # Output file pattern
-        if 'VLLM_PROFILER_OUTPUT' in os.environ:
-            self.output_file_pattern = os.environ['VLLM_PROFILER_OUTPUT']
+        if 'VLLM_PROFILER_OUTPUT' in env:
+            self.output_file_pattern = env['VLLM_PROFILER_OUTPUT']
 
         # Chrome trace export
-        if 'VLLM_PROFILER_EXPORT_TRACE' in os.environ:
-            self.export_chrome_trace = os.environ['VLLM_PROFILER_EXPORT_TRACE'].lower() in ('true', '1', 'yes')
+        self.export_chrome_trace = _envbool(env, 'VLLM_PROFILER_EXPORT_TRACE', self.export_chrome_trace)
 
         # Debug mode
-        if 'VLLM_PROFILER_DEBUG' in os.environ:
-            self.debug = os.environ['VLLM_PROFILER_DEBUG'].lower() in ('true', '1', 'yes')
+        self.debug = _envbool(env, 'VLLM_PROFILER_DEBUG', self.debug)
+
+        # Lightweight preset: force off every per-op extra regardless of
+        # what the config file enabled
+        if _envbool(env, 'VLLM_PROFILER_LIGHTWEIGHT', False):
+            self.record_shapes = False
+            self.with_stack = False
+            self.with_modules = False
+            self.profile_memory = False
 
     def _parse_ranges(self, ranges_str: str) -> List[Tuple[int, int]]:
         """
@@ -169,15 +192,10 @@ class ProfilerConfig:
             "50-100,200-300" -> [(50, 100), (200, 300)]
             "0-50,100-150,300-350" -> [(0, 50), (100, 150), (300, 350)]
         """
-        ranges = []
-        for range_str in ranges_str.split(','):
-            range_str = range_str.strip()
-            if '-' in range_str:
-                try:
-                    start, end = range_str.split('-')
-                    ranges.append((int(start), int(end)))
-                except ValueError as e:
-                    print(f"[profiler-config] Warning: Invalid range '{range_str}': {e}")
+        ranges = [(int(start), int(end)) for start, end in _RANGE_RE.findall(ranges_str)]
+        expected = sum(1 for part in ranges_str.split(',') if part.strip())
+        if len(ranges) != expected:
+            print(f"[profiler-config] Warning: Some ranges in '{ranges_str}' could not be parsed")
         return ranges
 
     def get_output_filename(self, pid: Optional[int] = None, rank: Optional[int] = None,
@@ -202,6 +220,20 @@ _config = ProfilerConfig()
 # Import Hook
 # ==============================================================================
 
+# Interned copy of the target module name, bound at module scope so
+# find_spec avoids the _config attribute walk on every import. The import
+# system interns module names in the common paths, so the identity check
+# usually short-circuits the string compare; the == fallback keeps
+# correctness for non-interned dynamic imports.
+_TARGET = sys.intern(_config.target_module)
+
+
+# Set once the target module has been wrapped. Monotonic false->true, so
+# consumers (e.g. a future hot-reload watcher thread) can test one Event
+# instead of doing a sys.modules dict lookup per check.
+target_wrapped = threading.Event()
+
+
 class PostImportLoader(importlib.abc.Loader):
     def __init__(self, loader):
         self.loader = loader
@@ -215,14 +247,19 @@ class PostImportLoader(importlib.abc.Loader):
         self.loader.exec_module(module)
         if _config.debug:
             print(f"[profiler] {module.__name__} loaded")
-        safe_wrap_function(module)
+        if safe_wrap_function(module):
+            target_wrapped.set()
+            # The target module only loads once per process; once it is
+            # wrapped the finder has nothing left to do, so uninstall it to
+            # stop paying a meta_path dispatch on every subsequent import.
+            uninstall_import_hook()
         if _config.debug:
             print(f"[profiler] {module.__name__} wrapped")
 
 
 class PostImportFinder(importlib.abc.MetaPathFinder):
     def find_spec(self, fullname, path, target=None):
-        if fullname != _config.target_module:
+        if fullname is not _TARGET and fullname != _TARGET:
             return None
 
         # Prevent recursive lookup
@@ -238,103 +275,318 @@ class PostImportFinder(importlib.abc.MetaPathFinder):
         return None
 
 
-# Install the import hook
-sys.meta_path.insert(0, PostImportFinder())
+def uninstall_import_hook():
+    """Remove all PostImportFinder instances from sys.meta_path."""
+    sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, PostImportFinder)]
+
+
+# Install the import hook (at most one finder, even if this module is
+# somehow loaded twice)
+if not any(isinstance(f, PostImportFinder) for f in sys.meta_path):
+    sys.meta_path.insert(0, PostImportFinder())
 
 
 # ==============================================================================
 # Profiler Wrapper
 # ==============================================================================
 
-def wrap_func_with_profiler(original_func):
+# RAM-backed staging directory for trace export, when available. Writing
+# the trace into tmpfs is a memcpy; the move to the final (possibly slow
+# or network-backed) destination happens on a separate thread.
+_SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Raw stderr fd for messages emitted from the inference thread: a single
+# os.write avoids the stdout lock, str.format machinery, and line-buffered
+# flush that print() pays on every call.
+_LOG_FD = 2
+
+# In-flight tmpfs-to-destination movers, joined by the atexit drain so a
+# process exit never truncates a trace mid-move.
+_mover_threads = []
+
+
+def _move_staged_trace(staged, output_file):
+    shutil.move(staged, output_file)
+    print(f"[profiler] Exported trace to: {output_file}")
+
+
+def _handle_trace_ready(prof, range_start, range_end):
+    """Format stats and export the trace for a completed profiling range.
+
+    Runs on a background thread (analogous to torch.profiler's
+    on_trace_ready callback) so table formatting and trace serialization
+    never block the inference thread that triggered the range stop.
+    """
+    if _config.print_stats:
+        print("===== begin profiler output")
+        if _config.table_enabled:
+            print(prof.key_averages().table(
+                sort_by=_config.table_sort_by,
+                row_limit=_config.table_row_limit
+            ))
+        print("===== end profiler output")
+
+    if _config.export_chrome_trace:
+        output_file = _config.get_output_filename(range_start=range_start, range_end=range_end)
+        if _SHM_DIR and not output_file.startswith(_SHM_DIR):
+            # Stage in tmpfs, then hand the disk write to another thread so
+            # it overlaps with subsequent profiling/inference work. The
+            # mover logs success itself once the move lands (a cross-fs
+            # move interrupted at exit would leave a truncated file) and is
+            # tracked so the atexit drain can join it.
+            staged = os.path.join(
+                _SHM_DIR, f"trace_{os.getpid()}_{range_start}-{range_end}.json")
+            prof.export_chrome_trace(staged)
+            _mover_threads[:] = [t for t in _mover_threads if t.is_alive()]
+            mover = threading.Thread(
+                target=_move_staged_trace, args=(staged, output_file), daemon=True)
+            _mover_threads.append(mover)
+            mover.start()
+        else:
+            prof.export_chrome_trace(output_file)
+            print(f"[profiler] Exported trace to: {output_file}")
+    else:
+        print(f"[profiler] Chrome trace export disabled (export_chrome_trace=false)")
+
+
+# Single-consumer export queue, created on first use. One long-lived
+# worker drains it, so closing a range is a Queue.put handoff rather than
+# a thread spawn, and exports from back-to-back ranges serialize instead
+# of competing for I/O.
+_export_queue = None
+_export_queue_lock = threading.Lock()
+
+
+def _export_worker():
+    while True:
+        item = _export_queue.get()
+        if item is None:
+            # Shutdown sentinel from the atexit drain
+            _export_queue.task_done()
+            return
+        prof, range_start, range_end = item
+        try:
+            _handle_trace_ready(prof, range_start, range_end)
+        except Exception as e:
+            print(f"[profiler] Error exporting trace for range {range_start}-{range_end}: {e}")
+        finally:
+            _export_queue.task_done()
+
+
+def _drain_exports_at_exit():
+    """Flush pending trace exports before interpreter shutdown.
+
+    The export worker is a daemon thread, so without this a trace whose
+    range closed just before process exit (profiling the final steps of a
+    run is a primary use case) would be silently dropped.
+    """
+    if _export_queue is not None:
+        _export_queue.put(None)
+        _export_queue.join()
+    # Draining the queue may have spawned tmpfs movers; wait for them so
+    # the destination file is never left truncated by interpreter teardown.
+    for mover in _mover_threads:
+        mover.join()
+
+
+def _enqueue_trace_ready(prof, range_start, range_end):
+    """Queue a finished profiler for export on the background writer."""
+    global _export_queue
+    if _export_queue is None:
+        with _export_queue_lock:
+            if _export_queue is None:
+                import atexit
+                import queue
+                atexit.register(_drain_exports_at_exit)
+                _export_queue = queue.Queue()
+                threading.Thread(target=_export_worker, daemon=True).start()
+    _export_queue.put((prof, range_start, range_end))
+
+
+def wrap_func_with_profiler(original_func, target_class=None):
     """
     Wraps a function with PyTorch profiler that activates for configured ranges.
 
     Supports multiple profiling windows, e.g., calls 50-100 and 200-300.
+
+    When target_class is given, the original method is restored on it after
+    the last range completes so steady-state calls pay no wrapper cost.
     """
-    import torch
     import functools
-    from torch.profiler import profile, ProfilerActivity
-
-    # Parse activities
-    activities = []
-    for activity in _config.activities:
-        if activity.upper() == "CPU":
-            activities.append(ProfilerActivity.CPU)
-        elif activity.upper() == "CUDA":
-            activities.append(ProfilerActivity.CUDA)
-
-    # Create profiler instance
-    prof = profile(
-        activities=activities,
-        record_shapes=_config.record_shapes,
-        with_stack=_config.with_stack,
-        profile_memory=_config.profile_memory,
-        with_modules=_config.with_modules
-    )
-
-    # Track call count and current profiling range index
-    count = 0
+    import itertools
+
+    # Built lazily on the first call that opens a profiling window, so the
+    # torch.profiler import and profiler construction stay off the module
+    # load path (this function runs during vLLM's startup import of the
+    # target module).
+    prof = None
+
+    def _build_profiler():
+        from torch.profiler import profile, ProfilerActivity
+
+        # Parse activities
+        activities = []
+        for activity in _config.activities:
+            if activity.upper() == "CPU":
+                activities.append(ProfilerActivity.CPU)
+            elif activity.upper() == "CUDA":
+                activities.append(ProfilerActivity.CUDA)
+
+        # Log the effective options so users know why shapes/stacks are
+        # absent from a trace (both default to off for overhead reasons).
+        print(f"[profiler] Profiler options: record_shapes={_config.record_shapes} "
+              f"with_stack={_config.with_stack} profile_memory={_config.profile_memory} "
+              f"with_modules={_config.with_modules}", file=sys.stderr)
+
+        return profile(
+            activities=activities,
+            record_shapes=_config.record_shapes,
+            with_stack=_config.with_stack,
+            profile_memory=_config.profile_memory,
+            with_modules=_config.with_modules
+        )
+
+    # One-slot handoff for a profiler pre-built between ranges. Reusing a
+    # single profile object across ranges is not safe (events accumulate
+    # and the async exporter still owns it), but construction — including
+    # Kineto/CUPTI setup — can be paid in the gap between ranges instead
+    # of at the next range start.
+    next_prof = [None]
+    next_prof_ready = threading.Event()
+
+    def _prepare_next_prof():
+        next_prof[0] = _build_profiler()
+        next_prof_ready.set()
+
+    # Call counter: itertools.count increments in C, avoiding a Python-level
+    # add plus a nonlocal cell write on every call.
+    counter = itertools.count(1)
     current_range_idx = 0
     profiling_active = False
 
+    # Range boundaries as parallel tuples bound in closure scope: advancing
+    # to the next range is two LOAD_DEREF + BINARY_SUBSCR instead of the
+    # _config attribute walk plus list index plus tuple unpack.
+    starts = tuple(r[0] for r in _config.ranges)
+    ends = tuple(r[1] for r in _config.ranges)
+    n_ranges = len(starts)
+
+    # Boundaries of the current range as local scalars so the hot path is a
+    # single integer compare rather than a list index + tuple unpack.
+    next_start, next_end = starts[0], ends[0]
+
+    # Messages written from the inference thread are preformatted bytes
+    # (bytes %-formatting runs in C) pushed out with one os.write each.
+    restore_msg = ("[profiler] All ranges complete; restoring original "
+                   f"{_config.target_method}\n").encode()
+
+    # Single range (the common configuration): synthesize a specialized
+    # wrapper with start/end baked into the bytecode as integer literals.
+    # Dispatch is then two int-constant compares — no range bookkeeping,
+    # no boundary-tuple nonlocals. The call counter starts at 1, so a
+    # 0-start range can never open: only specialize for start >= 1 and
+    # let the general wrapper below (whose stop branch is gated on
+    # profiling_active) skip such ranges safely.
+    if len(_config.ranges) == 1 and 1 <= next_start < next_end:
+        start, end = next_start, next_end
+
+        def _on_stop(finished_prof):
+            _enqueue_trace_ready(finished_prof, start, end)
+            if target_class is not None:
+                os.write(_LOG_FD, restore_msg)
+                setattr(target_class, _config.target_method, original_func)
+
+        src = (
+            "def _make(original_func, counter, build_profiler, on_stop):\n"
+            "    prof = None\n"
+            "    def specialized_func(*args, **kwargs):\n"
+            "        nonlocal prof\n"
+            "        count = next(counter)\n"
+            f"        if count == {start}:\n"
+            "            os.write(_LOG_FD, _START_MSG)\n"
+            "            prof = build_profiler()\n"
+            "            prof.start()\n"
+            f"        elif count == {end}:\n"
+            "            os.write(_LOG_FD, _STOP_MSG)\n"
+            "            prof.stop()\n"
+            "            on_stop(prof)\n"
+            "            prof = None\n"
+            "        return original_func(*args, **kwargs)\n"
+            "    return specialized_func\n"
+        )
+        ns = {
+            'os': os,
+            '_LOG_FD': _LOG_FD,
+            '_START_MSG': b"[profiler] Starting profiler for range %d-%d (call #%d)\n"
+                          % (start, end, start),
+            '_STOP_MSG': b"[profiler] Stopping profiler for range %d-%d (call #%d)\n"
+                         % (start, end, end),
+        }
+        exec(src, ns)
+        specialized_func = ns['_make'](original_func, counter, _build_profiler, _on_stop)
+        specialized_func = functools.wraps(original_func)(specialized_func)
+        specialized_func.__profiler_wrapped__ = True
+        return specialized_func
+
     @functools.wraps(original_func)
     def wrapped_func(*args, **kwargs):
-        nonlocal count, current_range_idx, profiling_active, prof
-
-        count += 1
-
-        # Check if we should start profiling
-        if not profiling_active and current_range_idx < len(_config.ranges):
-            start, end = _config.ranges[current_range_idx]
-            if count == start:
-                print(f"[profiler] Starting profiler for range {start}-{end} (call #{count})")
-                prof.start()
-                profiling_active = True
-
-        # Check if we should stop profiling
-        if profiling_active:
-            start, end = _config.ranges[current_range_idx]
-            if count == end:
-                print(f"[profiler] Stopping profiler for range {start}-{end} (call #{count})")
-                prof.stop()
-                profiling_active = False
-
-                # Print and export results
-                if _config.print_stats:
-                    print("===== begin profiler output")
-                    if _config.table_enabled:
-                        print(prof.key_averages().table(
-                            sort_by=_config.table_sort_by,
-                            row_limit=_config.table_row_limit
-                        ))
-                    print("===== end profiler output")
-
-                # Optionally export Chrome trace file
-                if _config.export_chrome_trace:
-                    output_file = _config.get_output_filename(range_start=start, range_end=end)
-                    prof.export_chrome_trace(output_file)
-                    print(f"[profiler] Exported trace to: {output_file}")
+        nonlocal current_range_idx, profiling_active, prof
+        nonlocal next_start, next_end
+
+        count = next(counter)
+
+        # Fast path: outside any profiling window, hand off immediately.
+        if not profiling_active:
+            if count != next_start:
+                return original_func(*args, **kwargs)
+            os.write(_LOG_FD, b"[profiler] Starting profiler for range %d-%d (call #%d)\n"
+                     % (next_start, next_end, count))
+            if prof is None:
+                if next_prof_ready.is_set():
+                    prof = next_prof[0]
+                    next_prof[0] = None
                 else:
-                    print(f"[profiler] Chrome trace export disabled (export_chrome_trace=false)")
-
-                # Move to next range
-                current_range_idx += 1
+                    prof = _build_profiler()
+            prof.start()
+            profiling_active = True
 
-                # Create new profiler for next range if exists
-                if current_range_idx < len(_config.ranges):
-                    prof = profile(
-                        activities=activities,
-                        record_shapes=_config.record_shapes,
-                        with_stack=_config.with_stack,
-                        profile_memory=_config.profile_memory,
-                        with_modules=_config.with_modules
-                    )
+        # Check if we should stop profiling
+        if count == next_end:
+            start, end = next_start, next_end
+            os.write(_LOG_FD, b"[profiler] Stopping profiler for range %d-%d (call #%d)\n"
+                     % (start, end, count))
+            prof.stop()
+            profiling_active = False
+
+            # Hand the finished profiler to the background export worker;
+            # the next range gets a fresh profiler object below, so there
+            # is no sharing.
+            _enqueue_trace_ready(prof, start, end)
+
+            # Move to next range
+            current_range_idx += 1
+
+            # Pre-build the profiler for the next range off-thread so its
+            # setup cost lands between ranges, not on the starting call
+            if current_range_idx < n_ranges:
+                next_start = starts[current_range_idx]
+                next_end = ends[current_range_idx]
+                prof = None
+                next_prof_ready.clear()
+                threading.Thread(target=_prepare_next_prof, daemon=True).start()
+            elif target_class is not None:
+                # All ranges done: restore the naked method so future calls
+                # skip the wrapper entirely via normal method dispatch.
+                os.write(_LOG_FD, restore_msg)
+                setattr(target_class, _config.target_method, original_func)
 
         # Call original function
         result = original_func(*args, **kwargs)
         return result
 
+    # Sentinel so wrap_function can detect an already-wrapped method and
+    # never stack a second profiler closure on the hot path.
+    wrapped_func.__profiler_wrapped__ = True
     return wrapped_func
 
 
@@ -343,17 +595,22 @@ def wrap_func_with_profiler(original_func):
 # ==============================================================================
 
 def safe_wrap_function(module=None):
-    """Safely wrap the target function with error handling."""
+    """Safely wrap the target function with error handling.
+
+    Returns True if wrapping completed without raising, False otherwise.
+    """
     try:
         mod = module or sys.modules.get(_config.target_module)
         if mod is None:
-            return
+            return False
         wrap_function(mod)
+        return True
     except Exception as e:
         print(f"[profiler] Error wrapping function: {e}")
         if _config.debug:
             import traceback
             traceback.print_exc()
+        return False
 
 
 def wrap_function(mod):
@@ -368,10 +625,16 @@ def wrap_function(mod):
         print(f"[profiler] Warning: Method '{_config.target_method}' not found in {_config.target_class}")
         return
 
+    if getattr(original_method, '__profiler_wrapped__', False):
+        if _config.debug:
+            print(f"[profiler] {_config.target_class}.{_config.target_method} already wrapped; skipping")
+        return
+
     if _config.debug:
         print(f"[profiler] Wrapping {_config.target_class}.{_config.target_method}")
 
-    setattr(target_class, _config.target_method, wrap_func_with_profiler(original_method))
+    setattr(target_class, _config.target_method,
+            wrap_func_with_profiler(original_method, target_class))
 
 
 def unwrap_function():
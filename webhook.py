@@ -3,12 +3,52 @@ import base64
 import json
 import os
 import logging
-from typing import Any, Dict, List, Tuple
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+
+try:
+    import orjson
+except ImportError:
+    # orjson not available, fall back to stdlib json
+    orjson = None
 
 app = Flask(__name__)
 
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson's C encoder/decoder."""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s: Any, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+# Decoder for raw request bodies (orjson when available)
+_json_loads = orjson.loads if orjson is not None else json.loads
+_json_dumps_bytes = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode())
+
+# Pre-serialized allow-without-patch response. The majority of admissions
+# in a broad webhook scope are rejected by the early filters; for those the
+# only per-request content is the uid, so the response is a byte template
+# with one substitution instead of a dict build plus JSON encode.
+_ALLOW_RESPONSE_TEMPLATE = (
+    b'{"apiVersion":"admission.k8s.io/v1","kind":"AdmissionReview",'
+    b'"response":{"uid":%s,"allowed":true}}'
+)
+
+
+def allow_response(uid: Any) -> Response:
+    """Build an allow-without-patch AdmissionReview response."""
+    return Response(_ALLOW_RESPONSE_TEMPLATE % _json_dumps_bytes(uid),
+                    mimetype="application/json")
+
 # Configuration via environment variables
 TARGET_NAMESPACE = os.getenv("TARGET_NAMESPACE", "")
 # Legacy single label matching (deprecated but still supported)
@@ -34,9 +74,52 @@ FILE_KEYS = [
     {"key": "profiler_config.yaml", "mountPath": "/home/vllm/profiler/profiler_config.yaml"},
 ]
 
+# Compact pair for env vars on the admission path: a namedtuple is one
+# allocation versus a dict's header plus hash table, and the values are
+# only ever read. The {"name": ..., "value": ...} dict shape Kubernetes
+# expects is materialized at the point an op is appended to the patch.
+EnvVar = namedtuple("EnvVar", ("name", "value"))
+
 # Profiler configuration annotation prefix
 PROFILER_ANNOTATION_PREFIX = "vllm.profiler/"
 
+# Full annotation key -> environment variable name, prebuilt so request
+# handling never formats annotation-key strings
+_ANNOTATION_TO_ENV = {
+    f"{PROFILER_ANNOTATION_PREFIX}{suffix}": env_name
+    for suffix, env_name in {
+        "ranges": "VLLM_PROFILER_RANGES",
+        "activities": "VLLM_PROFILER_ACTIVITIES",
+        "record-shapes": "VLLM_PROFILER_RECORD_SHAPES",
+        "with-stack": "VLLM_PROFILER_WITH_STACK",
+        "memory": "VLLM_PROFILER_MEMORY",
+        "output": "VLLM_PROFILER_OUTPUT",
+        "export-trace": "VLLM_PROFILER_EXPORT_TRACE",
+        "debug": "VLLM_PROFILER_DEBUG",
+    }.items()
+}
+
+# Static patch fragments, built once: these dicts are only ever read and
+# JSON-serialized downstream, so the same objects can be appended to every
+# patch instead of being reallocated per request.
+_VOLUME_VALUE = {
+    "name": FILES_VOLUME_NAME,
+    "configMap": {
+        "name": FILES_CONFIGMAP_NAME
+    }
+}
+# Target mount paths as a frozenset for the already-instrumented check
+_FILE_MOUNT_PATHS = frozenset(f["mountPath"] for f in FILE_KEYS)
+_MOUNT_TEMPLATES = tuple(
+    {
+        "name": FILES_VOLUME_NAME,
+        "mountPath": f["mountPath"],
+        "subPath": f["key"],
+        "readOnly": True,
+    }
+    for f in FILE_KEYS
+)
+
 def parse_target_labels(labels_str: str) -> List[Tuple[str, str]]:
     """
     Parse TARGET_LABELS environment variable into list of (key, value) tuples.
@@ -55,10 +138,17 @@ def parse_target_labels(labels_str: str) -> List[Tuple[str, str]]:
             key, value = pair.split('=', 1)  # Split on first '=' only
             labels.append((key.strip(), value.strip()))
         else:
-            logger.warning(f"Invalid label pair (missing '='): '{pair}'")
+            logger.warning("Invalid label pair (missing '='): '%s'", pair)
     return labels
 
-def matches_any_label(pod_labels: Dict[str, str], target_labels: List[Tuple[str, str]]) -> bool:
+# The label selector cannot change for the life of the process, so parse it
+# once at import instead of splitting/stripping TARGET_LABELS on every
+# admission request.
+_TARGET_LABEL_PAIRS: Tuple[Tuple[str, str], ...] = tuple(parse_target_labels(TARGET_LABELS))
+_USE_MULTI_LABEL = bool(_TARGET_LABEL_PAIRS)
+
+
+def matches_any_label(pod_labels: Dict[str, str], target_labels: Tuple[Tuple[str, str], ...]) -> bool:
     """
     Check if pod has ANY of the target labels (OR logic).
 
@@ -66,11 +156,11 @@ def matches_any_label(pod_labels: Dict[str, str], target_labels: List[Tuple[str,
     """
     for key, value in target_labels:
         if pod_labels.get(key) == value:
-            logger.debug(f"Pod matched on label '{key}'='{value}'")
+            logger.debug("Pod matched on label '%s'='%s'", key, value)
             return True
     return False
 
-def extract_profiler_env_from_annotations(annotations: Dict[str, str]) -> List[Dict[str, str]]:
+def extract_profiler_env_from_annotations(annotations: Dict[str, str]) -> List[EnvVar]:
     """
     Extract profiler configuration from pod annotations and convert to environment variables.
 
@@ -83,78 +173,147 @@ def extract_profiler_env_from_annotations(annotations: Dict[str, str]) -> List[D
         vllm.profiler/output: "trace_custom.json"
         vllm.profiler/debug: "true"
 
-    Returns list of {"name": "ENV_VAR", "value": "value"} dicts.
+    Returns list of EnvVar(name, value) tuples.
     """
     env_vars = []
 
-    # Mapping from annotation suffix to environment variable name
-    annotation_to_env = {
-        "ranges": "VLLM_PROFILER_RANGES",
-        "activities": "VLLM_PROFILER_ACTIVITIES",
-        "record-shapes": "VLLM_PROFILER_RECORD_SHAPES",
-        "with-stack": "VLLM_PROFILER_WITH_STACK",
-        "memory": "VLLM_PROFILER_MEMORY",
-        "output": "VLLM_PROFILER_OUTPUT",
-        "export-trace": "VLLM_PROFILER_EXPORT_TRACE",
-        "debug": "VLLM_PROFILER_DEBUG",
-    }
-
-    for annotation_suffix, env_name in annotation_to_env.items():
-        annotation_key = f"{PROFILER_ANNOTATION_PREFIX}{annotation_suffix}"
-        if annotation_key in annotations:
-            env_vars.append({
-                "name": env_name,
-                "value": annotations[annotation_key]
-            })
-            logger.debug(f"Found profiler annotation '{annotation_key}' -> {env_name}='{annotations[annotation_key]}'")
+    # Iterate the pod's annotations (typically few, often none) against the
+    # prebuilt lookup rather than formatting all 8 candidate keys per call
+    for annotation_key, value in annotations.items():
+        env_name = _ANNOTATION_TO_ENV.get(annotation_key)
+        if env_name is not None:
+            env_vars.append(EnvVar(env_name, value))
+            logger.debug("Found profiler annotation '%s' -> %s='%s'", annotation_key, env_name, value)
 
     return env_vars
 
-def build_env_patch_for_pod(pod: Dict[str, Any], env_vars: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+# Pre-serialized patch fragments for the common pod shape (fresh pod, no
+# pre-existing env/volumes/mounts): the whole JSONPatch is stitched from
+# these byte templates, skipping the list-of-dicts build and the full
+# json.dumps pass. Built once at import since the volume and mount values
+# never change for the life of the process.
+_FAST_PATCH_PREFIX = (
+    b'[{"op":"add","path":"/spec/volumes","value":['
+    + _json_dumps_bytes(_VOLUME_VALUE)
+    + b']}'
+)
+_FAST_CONTAINER_TEMPLATE = (
+    b',{"op":"add","path":"/spec/containers/%d/env","value":%s}'
+    b',{"op":"add","path":"/spec/containers/%d/volumeMounts","value":%s}'
+)
+_FAST_MOUNTS_JSON = _json_dumps_bytes(list(_MOUNT_TEMPLATES))
+
+
+def build_patch_bytes_fast(pod: Dict[str, Any], env_vars: List[EnvVar]) -> Optional[bytes]:
     """
-    Build JSON patch operations to inject environment variables into all containers.
+    Emit the whole JSONPatch as bytes for the predictable pod shape: no
+    pre-existing volumes, and no env or volumeMounts on any container.
+
+    That shape needs no replace/dedup logic, so the patch is a fixed
+    skeleton where only the env array and container indices vary; the env
+    array is serialized once and reused for every container.
+
+    Returns the patch bytes, or None when the pod has pre-existing state
+    and the caller must fall back to build_all_patches().
+    """
+    spec = pod.get("spec", {}) or {}
+    containers = spec.get("containers", [])
+    if not containers or spec.get("volumes"):
+        return None
+    for container in containers:
+        if container.get("env") or container.get("volumeMounts"):
+            return None
+
+    env_json = _json_dumps_bytes([{"name": ev.name, "value": ev.value} for ev in env_vars])
+    parts = [_FAST_PATCH_PREFIX]
+    for idx in range(len(containers)):
+        parts.append(_FAST_CONTAINER_TEMPLATE % (idx, env_json, idx, _FAST_MOUNTS_JSON))
+    parts.append(b']')
+    return b''.join(parts)
+
+
+def build_all_patches(pod: Dict[str, Any], env_vars: List[EnvVar]) -> List[Dict[str, Any]]:
+    """
+    Build all JSON patch operations for a pod in one container pass:
+    environment variable injection plus the profiler files volume/mounts.
 
     Args:
         pod: The pod object to patch
-        env_vars: List of {"name": "ENV_NAME", "value": "value"} dicts
+        env_vars: List of EnvVar(name, value) tuples
 
     Returns:
         List of JSON patch operations
     """
     patch: List[Dict[str, Any]] = []
-    containers = pod.get("spec", {}).get("containers", [])
+    spec = pod.get("spec", {}) or {}
+    volumes = spec.get("volumes", [])
+    containers = spec.get("containers", [])
 
-    logger.debug("Building env patch for %d container(s) with %d env var(s)", len(containers), len(env_vars))
+    # Hoisted once: gates all per-container/per-var debug work, including
+    # the fallback container-name f-string
+    _dbg = logger.isEnabledFor(logging.DEBUG)
+    if _dbg:
+        logger.debug("Building patches for %d container(s) with %d env var(s)", len(containers), len(env_vars))
 
-    for container_index, container in enumerate(containers):
+    # Volume-level setup happens once, before the container pass
+    volume_present = any(v.get("name") == FILES_VOLUME_NAME for v in volumes)
+    if not volume_present:
+        if _dbg:
+            logger.debug("Adding volume '%s' from ConfigMap '%s'", FILES_VOLUME_NAME, FILES_CONFIGMAP_NAME)
+        if volumes:
+            patch.append({
+                "op": "add",
+                "path": "/spec/volumes/-",
+                "value": _VOLUME_VALUE
+            })
+        else:
+            patch.append({
+                "op": "add",
+                "path": "/spec/volumes",
+                "value": [_VOLUME_VALUE]
+            })
+    elif _dbg:
+        logger.debug("Volume '%s' already present; skipping add", FILES_VOLUME_NAME)
+
+    # Single pass over containers: emit env ops and mount ops together so
+    # each container dict is walked once
+    for idx, container in enumerate(containers):
         env_list = container.get("env", [])
-        cname = container.get("name", f"idx-{container_index}")
-        logger.debug("Inspecting container '%s' (index=%d); current env count=%d", cname, container_index, len(env_list))
+        if _dbg:
+            cname = container.get("name", f"idx-{idx}")
+            logger.debug("Inspecting container '%s' (index=%d); current env count=%d", cname, idx, len(env_list))
+
+        # --- Environment variable injection ---
+
+        # Index existing env vars by name once, so each injected var is a
+        # hash lookup instead of a scan over the whole env list
+        existing_by_name = {item.get("name"): i for i, item in enumerate(env_list)}
 
         # Build list of env vars to add
         env_to_add = []
 
-        for env_var in env_vars:
-            env_name = env_var["name"]
-            env_value = env_var["value"]
+        for env_name, env_value in env_vars:
 
-            # Check if env var already exists
-            existing_index = -1
-            for i, item in enumerate(env_list):
-                if item.get("name") == env_name:
-                    existing_index = i
-                    break
+            existing_index = existing_by_name.get(env_name, -1)
 
             if existing_index >= 0:
+                # Already at the target value: emitting a replace would just
+                # pad the patch with a no-op for the apiserver to apply
+                if env_list[existing_index].get("value") == env_value:
+                    if _dbg:
+                        logger.debug("Container '%s': env '%s' already set to target value; skipping", cname, env_name)
+                    continue
                 # Replace existing env var
-                logger.debug("Container '%s': replacing existing env '%s' at index %d", cname, env_name, existing_index)
+                if _dbg:
+                    logger.debug("Container '%s': replacing existing env '%s' at index %d", cname, env_name, existing_index)
                 patch.append({
                     "op": "replace",
-                    "path": f"/spec/containers/{container_index}/env/{existing_index}/value",
+                    "path": f"/spec/containers/{idx}/env/{existing_index}/value",
                     "value": env_value,
                 })
             else:
-                # Queue for addition
+                # Queue for addition; the dict shape is built here, at the
+                # emission point, not when the env var list is assembled
                 env_to_add.append({"name": env_name, "value": env_value})
 
         # Add all new env vars in one operation
@@ -162,92 +321,60 @@ def build_env_patch_for_pod(pod: Dict[str, Any], env_vars: List[Dict[str, str]])
             if env_list:
                 # Container already has env list, append each var
                 for env_var in env_to_add:
-                    logger.debug("Container '%s': appending env '%s'", cname, env_var["name"])
+                    if _dbg:
+                        logger.debug("Container '%s': appending env '%s'", cname, env_var["name"])
                     patch.append({
                         "op": "add",
-                        "path": f"/spec/containers/{container_index}/env/-",
+                        "path": f"/spec/containers/{idx}/env/-",
                         "value": env_var,
                     })
             else:
                 # Container has no env list, create it with all vars
-                logger.debug("Container '%s': creating env list with %d var(s)", cname, len(env_to_add))
+                if _dbg:
+                    logger.debug("Container '%s': creating env list with %d var(s)", cname, len(env_to_add))
                 patch.append({
                     "op": "add",
-                    "path": f"/spec/containers/{container_index}/env",
+                    "path": f"/spec/containers/{idx}/env",
                     "value": env_to_add,
                 })
 
-    logger.debug("Patch operations prepared: %s", json.dumps(patch))
-    return patch
+        # --- Profiler files volumeMounts ---
 
-def build_files_volume_patch_for_pod(pod: Dict[str, Any]) -> List[Dict[str, Any]]:
-    patch: List[Dict[str, Any]] = []
-    spec = pod.get("spec", {}) or {}
-    volumes = spec.get("volumes", [])
-    containers = spec.get("containers", [])
-
-    # Add the files volume if missing
-    volume_present = any(v.get("name") == FILES_VOLUME_NAME for v in volumes)
-    if not volume_present:
-        logger.debug("Adding volume '%s' from ConfigMap '%s'", FILES_VOLUME_NAME, FILES_CONFIGMAP_NAME)
-        if volumes:
-            patch.append({
-                "op": "add",
-                "path": "/spec/volumes/-",
-                "value": {
-                    "name": FILES_VOLUME_NAME,
-                    "configMap": {
-                        "name": FILES_CONFIGMAP_NAME
-                    }
-                }
-            })
-        else:
-            patch.append({
-                "op": "add",
-                "path": "/spec/volumes",
-                "value": [{
-                    "name": FILES_VOLUME_NAME,
-                    "configMap": {
-                        "name": FILES_CONFIGMAP_NAME
-                    }
-                }]
-            })
-    else:
-        logger.debug("Volume '%s' already present; skipping add", FILES_VOLUME_NAME)
-
-    # For each container, add volumeMounts for each file using subPath
-    for idx, c in enumerate(containers):
-        mounts = c.get("volumeMounts", [])
+        mounts = container.get("volumeMounts", [])
         existing_mount_paths = {m.get("mountPath") for m in mounts}
+        # Already-instrumented container (the common re-admission case):
+        # one subset check, nothing to add
+        if _FILE_MOUNT_PATHS.issubset(existing_mount_paths):
+            if _dbg:
+                logger.debug("Container %s already has all profiler mounts", container.get("name", idx))
+            continue
         add_list = []
-        for f in FILE_KEYS:
-            if f["mountPath"] in existing_mount_paths:
-                logger.debug("Container %s already has mountPath %s", c.get("name", idx), f["mountPath"])
+        for m in _MOUNT_TEMPLATES:
+            if m["mountPath"] in existing_mount_paths:
+                if _dbg:
+                    logger.debug("Container %s already has mountPath %s", container.get("name", idx), m["mountPath"])
                 continue
-            add_list.append({
-                "name": FILES_VOLUME_NAME,
-                "mountPath": f["mountPath"],
-                "subPath": f["key"],
-                "readOnly": True,
-            })
+            add_list.append(m)
         if add_list:
             if mounts:
-                for m in add_list:
-                    logger.debug("Adding volumeMount to container %s: %s", c.get("name", idx), m)
-                    patch.append({
-                        "op": "add",
-                        "path": f"/spec/containers/{idx}/volumeMounts/-",
-                        "value": m
-                    })
+                # Container already has volumeMounts: all append ops share
+                # one precomputed path, emitted in a single extend
+                base_path = f"/spec/containers/{idx}/volumeMounts/-"
+                if _dbg:
+                    logger.debug("Adding %d volumeMount(s) to container %s: %s",
+                                 len(add_list), container.get("name", idx), add_list)
+                patch.extend({"op": "add", "path": base_path, "value": m} for m in add_list)
             else:
-                logger.debug("Creating volumeMounts for container %s with %d mount(s)", c.get("name", idx), len(add_list))
+                if _dbg:
+                    logger.debug("Creating volumeMounts for container %s with %d mount(s)", container.get("name", idx), len(add_list))
                 patch.append({
                     "op": "add",
                     "path": f"/spec/containers/{idx}/volumeMounts",
                     "value": add_list
                 })
 
-    logger.debug("Files volume/mount patch prepared: %s", json.dumps(patch))
+    if _dbg:
+        logger.debug("Patch operations prepared: %s", json.dumps(patch))
     return patch
 
 
@@ -258,7 +385,17 @@ def healthz():
 
 @app.route("/mutate", methods=["POST"])
 def mutate():
-    review = request.get_json(force=True, silent=True) or {}
+    # Decode the raw body directly: skips Flask's content-type sniffing and
+    # body re-caching, and the early-exit checks below only ever touch the
+    # handful of metadata fields they need — the pod spec is not walked
+    # unless the pod actually matches.
+    try:
+        review = _json_loads(request.get_data(cache=False)) or {}
+    except Exception:
+        # Malformed body: nothing to patch and no uid to echo, so answer
+        # allow immediately instead of walking an empty review dict
+        logger.debug("Failed to decode admission request body; allowing without patch")
+        return allow_response(None)
     req = review.get("request", {})
     uid = req.get("uid")
 
@@ -268,19 +405,9 @@ def mutate():
                  req.get("kind", {}).get("kind", ""),
                  req.get("operation", ""))
 
-    # Default AdmissionReview response: allow without changes
-    response_body: Dict[str, Any] = {
-        "apiVersion": "admission.k8s.io/v1",
-        "kind": "AdmissionReview",
-        "response": {
-            "uid": uid,
-            "allowed": True,
-        },
-    }
-
     if req.get("kind", {}).get("kind") != "Pod":
         logger.debug("Skipping non-Pod kind")
-        return jsonify(response_body)
+        return allow_response(uid)
 
     namespace = req.get("namespace", "")
     obj = req.get("object", {}) or {}
@@ -289,82 +416,106 @@ def mutate():
     annotations = metadata.get("annotations", {}) or {}
     name = metadata.get("name", "")
 
-    logger.debug("Pod admission: ns=%s name=%s labels=%s", namespace, name, labels)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Pod admission: ns=%s name=%s labels=%s", namespace, name, labels)
 
     # Check namespace
     if not TARGET_NAMESPACE:
         logger.debug("TARGET_NAMESPACE not configured; allowing without patch")
-        return jsonify(response_body)
+        return allow_response(uid)
     if namespace != TARGET_NAMESPACE:
         logger.debug("Namespace mismatch: got '%s' expected '%s'; allowing without patch", namespace, TARGET_NAMESPACE)
-        return jsonify(response_body)
+        return allow_response(uid)
 
     # Check labels (support both new and legacy modes)
     label_match = False
 
     if TARGET_LABELS:
-        # New mode: multiple labels with OR logic
-        target_label_pairs = parse_target_labels(TARGET_LABELS)
-        logger.debug(f"Using multi-label matching (OR logic): {target_label_pairs}")
-        if target_label_pairs:
-            label_match = matches_any_label(labels, target_label_pairs)
+        # New mode: multiple labels with OR logic (parsed once at import)
+        logger.debug("Using multi-label matching (OR logic): %s", _TARGET_LABEL_PAIRS)
+        if _USE_MULTI_LABEL:
+            label_match = matches_any_label(labels, _TARGET_LABEL_PAIRS)
             if not label_match:
-                logger.debug(f"Pod has none of the target labels {target_label_pairs}; allowing without patch")
-                return jsonify(response_body)
+                logger.debug("Pod has none of the target labels %s; allowing without patch", _TARGET_LABEL_PAIRS)
+                return allow_response(uid)
         else:
             logger.debug("TARGET_LABELS set but empty/invalid; allowing without patch")
-            return jsonify(response_body)
+            return allow_response(uid)
     elif TARGET_LABEL_KEY and TARGET_LABEL_VALUE:
         # Legacy mode: single label matching
-        logger.debug(f"Using legacy single-label matching: {TARGET_LABEL_KEY}={TARGET_LABEL_VALUE}")
+        logger.debug("Using legacy single-label matching: %s=%s", TARGET_LABEL_KEY, TARGET_LABEL_VALUE)
         if labels.get(TARGET_LABEL_KEY) != TARGET_LABEL_VALUE:
             logger.debug("Label mismatch: pod label '%s'='%s' expected value '%s'; allowing without patch",
                          TARGET_LABEL_KEY, labels.get(TARGET_LABEL_KEY), TARGET_LABEL_VALUE)
-            return jsonify(response_body)
+            return allow_response(uid)
         label_match = True
     else:
         logger.debug("No label selector configured (neither TARGET_LABELS nor TARGET_LABEL_KEY/VALUE); allowing without patch")
-        return jsonify(response_body)
+        return allow_response(uid)
 
     if not INJECT_ENV_NAME:
         logger.debug("INJECT_ENV_NAME not configured; allowing without patch")
-        return jsonify(response_body)
+        return allow_response(uid)
 
     # If we get here, namespace and labels matched
-    logger.debug(f"Pod matched! Proceeding with injection.")
+    logger.debug("Pod matched! Proceeding with injection.")
+
+    # AdmissionReview response for the patched path
+    response_body: Dict[str, Any] = {
+        "apiVersion": "admission.k8s.io/v1",
+        "kind": "AdmissionReview",
+        "response": {
+            "uid": uid,
+            "allowed": True,
+        },
+    }
 
     # Collect all environment variables to inject
-    env_vars_to_inject = [{"name": INJECT_ENV_NAME, "value": INJECT_ENV_VALUE}]
+    env_vars_to_inject = [EnvVar(INJECT_ENV_NAME, INJECT_ENV_VALUE)]
 
     # Extract and add profiler-specific configuration from annotations
     profiler_env_vars = extract_profiler_env_from_annotations(annotations)
     if profiler_env_vars:
-        logger.debug(f"Adding {len(profiler_env_vars)} profiler environment variable(s) from annotations")
+        logger.debug("Adding %d profiler environment variable(s) from annotations", len(profiler_env_vars))
         env_vars_to_inject.extend(profiler_env_vars)
 
-    # Build environment variable patches
-    patch_ops = build_env_patch_for_pod(obj, env_vars_to_inject)
-
-    # Mount configuration files
-    patch_ops.extend(build_files_volume_patch_for_pod(obj))
-
-    if patch_ops:
-        logger.debug("Emitting JSONPatch with %d operation(s)", len(patch_ops))
-        patch_str = json.dumps(patch_ops)
-        response_body["response"]["patchType"] = "JSONPatch"
-        response_body["response"]["patch"] = base64.b64encode(patch_str.encode("utf-8")).decode("utf-8")
+    # Fresh pods (the overwhelmingly common shape at admission time) take
+    # the template path: the patch bytes are stitched directly from
+    # pre-serialized fragments. Pods with pre-existing env/volumes/mounts
+    # need replace/dedup logic and fall back to the dict-based builder.
+    patch_bytes = build_patch_bytes_fast(obj, env_vars_to_inject)
+    if patch_bytes is not None:
+        logger.debug("Emitting JSONPatch from template fast path")
     else:
-        logger.debug("No patch operations generated; allowing without patch")
+        # Build env injection and file mount patches in one container pass
+        patch_ops = build_all_patches(obj, env_vars_to_inject)
+        if not patch_ops:
+            logger.debug("No patch operations generated; allowing without patch")
+            return allow_response(uid)
+        logger.debug("Emitting JSONPatch with %d operation(s)", len(patch_ops))
+        # orjson emits bytes directly, so the patch goes straight to base64
+        # with no intermediate str/UTF-8 round-trip
+        patch_bytes = _json_dumps_bytes(patch_ops)
+
+    response_body["response"]["patchType"] = "JSONPatch"
+    response_body["response"]["patch"] = base64.b64encode(patch_bytes).decode("ascii")
 
     return jsonify(response_body)
 
 
-if __name__ == "__main__":
-    # Basic validation on startup
-    if not os.path.exists(TLS_CERT_FILE) or not os.path.exists(TLS_KEY_FILE):
-        raise SystemExit(f"TLS cert/key not found at {TLS_CERT_FILE} / {TLS_KEY_FILE}")
+# ASGI entrypoint for hypercorn: HTTP/2 lets the apiserver multiplex
+# admission requests over one TLS connection, amortizing handshake cost.
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    asgi_app = WsgiToAsgi(app)
+except ImportError:
+    # asgiref not available; WSGI servers can still serve webhook:app
+    asgi_app = None
 
-    logger.info("Starting env-injector webhook on port %d", PORT)
+
+def log_startup_config():
+    """Log the effective configuration once at startup."""
+    logger.info("env-injector webhook configured for port %d", PORT)
     logger.info("Target namespace: %s", TARGET_NAMESPACE)
 
     if TARGET_LABELS:
@@ -378,13 +529,26 @@ if __name__ == "__main__":
 
     logger.info("Injection: %s=%s", INJECT_ENV_NAME, INJECT_ENV_VALUE)
     logger.info("TLS cert=%s key=%s", TLS_CERT_FILE, TLS_KEY_FILE)
+    # Surface missing TLS material at import instead of at the first
+    # handshake failure; hypercorn owns the actual SSLContext (built once
+    # per worker, with session resumption) so the files are only checked,
+    # not loaded, here.
+    for tls_file in (TLS_CERT_FILE, TLS_KEY_FILE):
+        if not os.path.exists(tls_file):
+            logger.warning("TLS file not found: %s (hypercorn will fail to start TLS)", tls_file)
     logger.info("Log level: %s", LOG_LEVEL)
 
-    app.run(
-        host="0.0.0.0",
-        port=PORT,
-        ssl_context=(TLS_CERT_FILE, TLS_KEY_FILE),
-        debug=False,
+
+log_startup_config()
+
+
+if __name__ == "__main__":
+    # The Werkzeug dev server is single-threaded and serializes admission
+    # requests; the container runs hypercorn instead (see Dockerfile).
+    raise SystemExit(
+        "Run under hypercorn, e.g.: hypercorn --workers 4 "
+        f"--certfile {TLS_CERT_FILE} --keyfile {TLS_KEY_FILE} "
+        f"--bind 0.0.0.0:{PORT} webhook:asgi_app"
     )
 
 